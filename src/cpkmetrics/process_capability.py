@@ -9,6 +9,19 @@ from typing import Optional
 
 from .utils.tableprinter import print_table
 
+# Rating labels in ascending order of Cpk and of absolute Cpa respectively. The position of each label doubles as its
+# compact integer code wherever results are serialized (see utils/exporters.py), so reordering them breaks stored data
+CPK_RATINGS: tuple[str, ...] = (
+    "Abnormally Poor",
+    "Poor",
+    "Low",
+    "Good",
+    "Great",
+    "Excellent",
+    "Abnormally High",
+)
+CPA_RATINGS: tuple[str, ...] = ("Level A", "Level B", "Level C", "Level D")
+
 
 class ProcessCapability:
     """
@@ -257,22 +270,7 @@ class ProcessCapability:
         # Type checker driven assignment (guard clause already placed before method call)
         cpk: float = self._cpk  # type: ignore
 
-        if cpk <= 0:
-            return "Abnormally Poor"
-        elif 0 < cpk <= 0.5:
-            return "Poor"
-        elif 0.5 < cpk <= 1:
-            return "Low"
-        elif 1 < cpk <= 1.33:
-            return "Good"
-        elif 1.33 < cpk <= 1.67:
-            return "Great"
-        elif 1.67 < cpk <= 2:
-            return "Excellent"
-        elif cpk > 2:
-            return "Abnormally High"
-        else:
-            raise ValueError
+        return rate_cpk(cpk)
 
     def _calculate_cpa_rating(self) -> str:
         """
@@ -283,13 +281,59 @@ class ProcessCapability:
         """
 
         # Type checker driven assignment (guard clause already placed before method call)
-        cpa: float = abs(self._cpa)  # type: ignore
-
-        if cpa < 0.125:
-            return "Level A"
-        elif cpa < 0.25:
-            return "Level B"
-        elif cpa < 0.5:
-            return "Level C"
-        else:
-            return "Level D"
+        cpa: float = self._cpa  # type: ignore
+
+        return rate_cpa(cpa)
+
+
+# The rating logic lives at module level (rather than only on the class) so that bulk calculations such as sweep.py can
+# rate raw values without instantiating ProcessCapability. Criteria are documented on the corresponding properties above.
+
+
+def rate_cpk(cpk: float) -> str:
+    """
+    Rate a Cpk value. See ProcessCapability.process_capability_index_rating for the criteria.
+
+    Returns:
+    - str: The rating of the Cpk value, one of CPK_RATINGS.
+
+    Raises:
+    - ValueError: If cpk is NaN.
+    """
+
+    if cpk <= 0:
+        return "Abnormally Poor"
+    elif 0 < cpk <= 0.5:
+        return "Poor"
+    elif 0.5 < cpk <= 1:
+        return "Low"
+    elif 1 < cpk <= 1.33:
+        return "Good"
+    elif 1.33 < cpk <= 1.67:
+        return "Great"
+    elif 1.67 < cpk <= 2:
+        return "Excellent"
+    elif cpk > 2:
+        return "Abnormally High"
+    else:
+        raise ValueError
+
+
+def rate_cpa(cpa: float) -> str:
+    """
+    Rate a Cpa value by its absolute value. See ProcessCapability.process_accuracy_rating for the criteria.
+
+    Returns:
+    - str: The rating of the Cpa value, one of CPA_RATINGS.
+    """
+
+    cpa = abs(cpa)
+
+    if cpa < 0.125:
+        return "Level A"
+    elif cpa < 0.25:
+        return "Level B"
+    elif cpa < 0.5:
+        return "Level C"
+    else:
+        return "Level D"
@@ -0,0 +1,273 @@
+"""
+State Store
+
+A persistent store of per-characteristic sufficient statistics (count, mean, sum of squared deviations, min, max) and spec
+limits, so that a long running scoring service can update its statistics incrementally and resume after a restart
+without rescanning the measurement history. Built on the standard library sqlite3 module to keep the package
+dependency free.
+
+Design notes:
+    - Running mean and variance are maintained with Welford's algorithm, which is numerically stable for single pass
+      updates (unlike accumulating sums of x and x^2).
+    - Updates are applied to an in-memory cache and only written to disk at checkpoints, in a single transaction with
+      one batched upsert of all changed characteristics. This keeps write amplification low for high frequency updates.
+    - Each characteristic carries an optional watermark (e.g. the offset or timestamp of the last measurement applied)
+      that is committed atomically with its statistics. After a crash, measurements since the last checkpoint are lost
+      from both statistics and watermark alike, so replaying measurements after the stored watermark restores the exact
+      statistics without double counting.
+    - Spec limits cannot be recovered by replaying measurements, so a limit change is checkpointed immediately. Limit
+      changes are rare, so the extra write is negligible.
+
+"""
+
+import math
+import sqlite3
+import time
+from collections.abc import Iterable
+from types import TracebackType
+from typing import NamedTuple, TypeVar
+
+from .process_capability import ProcessCapability
+
+# Anything sqlite can store natively works as a watermark, typically a sequence number, offset or ISO timestamp
+Watermark = int | float | str
+
+DEFAULT_CHECKPOINT_EVERY: int = 10000
+
+# Lets __enter__ return the subclass type when StateStore is subclassed. typing.Self needs Python 3.11 and
+# typing_extensions would be a dependency, hence the TypeVar
+_StateStoreT = TypeVar("_StateStoreT", bound="StateStore")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS characteristic_state (
+    key TEXT PRIMARY KEY,
+    n INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    min REAL,
+    max REAL,
+    usl REAL,
+    lsl REAL,
+    watermark
+)
+"""
+_COLUMNS = "key, n, mean, m2, min, max, usl, lsl, watermark"
+
+
+class CharacteristicState(NamedTuple):
+    """Sufficient statistics and spec limits for one characteristic."""
+
+    n: int
+    mean: float
+    m2: float  # Sum of squared deviations from the mean
+    min: float | None
+    max: float | None
+    usl: float | None
+    lsl: float | None
+    watermark: Watermark | None
+
+    @property
+    def stddev(self) -> float | None:
+        """Sample standard deviation (n - 1 denominator), or None with fewer than 2 measurements."""
+        if self.n < 2:
+            return None
+        return math.sqrt(self.m2 / (self.n - 1))
+
+
+_EMPTY_STATE = CharacteristicState(0, 0.0, 0.0, None, None, None, None, None)
+
+
+class StateStore:
+    """
+    A checkpointed, sqlite backed store of per-characteristic statistics.
+
+    Typical use in a scoring service:
+
+        with StateStore("state.db") as store:
+            resume_from = store.get("bore_diameter").watermark  # None on the very first run
+            for offset, batch in read_measurements(after=resume_from):
+                store.update("bore_diameter", batch, watermark=offset)
+            pc = store.capability("bore_diameter")
+    """
+
+    def __init__(
+        self,
+        path: str,
+        checkpoint_every: int | None = DEFAULT_CHECKPOINT_EVERY,
+        checkpoint_interval: float | None = None,
+    ):
+        """
+        Open (or create) a state store.
+
+        Args:
+            path: Path of the sqlite database file. ":memory:" gives a non-persistent store, useful for testing.
+            checkpoint_every: Number of measurements applied after which a checkpoint is taken automatically.
+                Defaults to DEFAULT_CHECKPOINT_EVERY. None disables the count trigger.
+            checkpoint_interval: Seconds after which pending changes are checkpointed, so low traffic characteristics
+                still reach disk. Checked on each update, so an idle store needs checkpoint() called externally (e.g. from
+                a timer). Defaults to None (no time trigger).
+
+        Raises:
+        - ValueError: If checkpoint_every is less than 1 or checkpoint_interval is not positive.
+        """
+        if checkpoint_every is not None and checkpoint_every < 1:
+            raise ValueError("Checkpoint interval must be at least 1.")
+        if checkpoint_interval is not None and not checkpoint_interval > 0:
+            raise ValueError("Checkpoint time interval must be positive.")
+
+        self._checkpoint_every = checkpoint_every
+        self._checkpoint_interval = checkpoint_interval
+        self._last_checkpoint: float = time.monotonic()
+        self._conn = sqlite3.connect(path)
+        # WAL lets checkpoints append rather than rewrite pages, and FULL sync makes each committed checkpoint durable
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+        # Characteristics are loaded lazily on first access and kept in memory; only changed ones are written back
+        self._cache: dict[str, CharacteristicState] = {}
+        self._dirty: set[str] = set()
+        self._pending: int = 0
+
+    def get(self, key: str) -> CharacteristicState:
+        """Current state of a characteristic, including updates not yet checkpointed.
+
+        Returns an empty state (n == 0) for characteristics that have never been seen.
+        """
+        state = self._cache.get(key)
+        if state is None:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM characteristic_state WHERE key = ?", (key,)
+            ).fetchone()
+            state = CharacteristicState(*row[1:]) if row is not None else _EMPTY_STATE
+            self._cache[key] = state
+        return state
+
+    def keys(self) -> list[str]:
+        """Keys of all characteristics, stored or pending."""
+        stored = {row[0] for row in self._conn.execute("SELECT key FROM characteristic_state")}
+        return sorted(stored | self._dirty)
+
+    def update(
+        self, key: str, values: Iterable[float], watermark: Watermark | None = None
+    ) -> CharacteristicState:
+        """Apply new measurements to a characteristic.
+
+        Args:
+            key: Identifier of the characteristic.
+            values: New measurements, applied in order.
+            watermark: Position of the last measurement in values, stored with the statistics. Defaults to None
+                (keep the current watermark).
+
+        Returns:
+            CharacteristicState: The updated state.
+
+        Raises:
+        - ValueError: If any measurement is NaN or infinite, or the statistics overflow. No state is changed.
+        """
+        # Validate the whole batch before touching any state, so a bad batch is rejected as a unit. Non-finite values
+        # would poison mean/m2 (stored as NULL by sqlite) and make every later checkpoint fail.
+        batch = [float(x) for x in values]
+        if not all(math.isfinite(x) for x in batch):
+            raise ValueError(f"Measurements for characteristic {key!r} must be finite.")
+
+        n, mean, m2, lo, hi, usl, lsl, current_watermark = self.get(key)
+
+        count = 0
+        for x in batch:
+            # Welford's update
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            lo = x if lo is None or x < lo else lo
+            hi = x if hi is None or x > hi else hi
+            count += 1
+        if not (math.isfinite(mean) and math.isfinite(m2)):
+            raise ValueError(f"Measurements for characteristic {key!r} overflow the float range.")
+
+        state = CharacteristicState(
+            n, mean, m2, lo, hi, usl, lsl, current_watermark if watermark is None else watermark
+        )
+        self._set(key, state)
+
+        self._pending += count
+        if (self._checkpoint_every is not None and self._pending >= self._checkpoint_every) or (
+            self._checkpoint_interval is not None
+            and time.monotonic() - self._last_checkpoint >= self._checkpoint_interval
+        ):
+            self.checkpoint()
+        return state
+
+    def set_limits(self, key: str, usl: float | None = None, lsl: float | None = None) -> None:
+        """Set the spec limits of a characteristic and checkpoint immediately, so the change survives a crash.
+
+        Limits are validated when metrics are requested.
+        """
+        self._set(key, self.get(key)._replace(usl=usl, lsl=lsl))
+        self.checkpoint()
+
+    def capability(self, key: str, print_results: bool = False) -> ProcessCapability:
+        """Process capability of a characteristic, computed straight from its stored statistics.
+
+        Args:
+            key: Identifier of the characteristic.
+            print_results: If True, print calculated metrics. Defaults to False, as this is intended for services.
+
+        Raises:
+        - ValueError: If the characteristic has fewer than 2 measurements.
+        - ValueError/TypeError: As raised by ProcessCapability for invalid statistics or spec limits.
+        """
+        state = self.get(key)
+        stddev = state.stddev
+        if stddev is None:
+            raise ValueError(
+                f"Characteristic {key!r} needs at least 2 measurements, has {state.n}."
+            )
+        return ProcessCapability(state.mean, stddev, state.usl, state.lsl, print_results)
+
+    def checkpoint(self) -> int:
+        """Write all changed characteristics to disk in a single transaction.
+
+        Returns:
+            int: The number of characteristics written.
+        """
+        self._last_checkpoint = time.monotonic()
+        if not self._dirty:
+            return 0
+        rows = [(key, *self._cache[key]) for key in self._dirty]
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO characteristic_state ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        self._dirty.clear()
+        self._pending = 0
+        return len(rows)
+
+    def close(self) -> None:
+        """Checkpoint any pending changes and close the database, even if the checkpoint fails."""
+        try:
+            self.checkpoint()
+        finally:
+            self._conn.close()
+
+    def __enter__(self: _StateStoreT) -> _StateStoreT:  # noqa: PYI019
+        """Enter the runtime context, returning the store itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context, checkpointing and closing the store."""
+        self.close()
+
+    def _set(self, key: str, state: CharacteristicState) -> None:
+        """Replace a characteristic's cached state and mark it for the next checkpoint."""
+        self._cache[key] = state
+        self._dirty.add(key)
@@ -0,0 +1,222 @@
+"""
+What-if Sweep
+
+Evaluates process capability over a full Cartesian grid of mean offsets x standard deviations x tolerances, as used in
+tolerance design studies. Building a ProcessCapability per grid point is needlessly slow for large grids (validation,
+attribute setup and optional printing for every point), so the metrics are computed here directly from the formulas.
+
+Design notes:
+    - The spec is assumed to be two-sided and centered on nominal: tolerance is the full spec width (USL - LSL) and the
+      mean offset is the distance of the process mean from nominal. Cp, Cpk and Cpa are translation invariant, so the
+      nominal value itself is not needed.
+    - In keeping with the package's zero dependency design, there is no numpy. Instead, terms are broadcast by hand: each
+      is computed once at the outermost grid axis it depends on (e.g. Cpa and its rating only depend on offset and
+      tolerance) and reused across the remaining axes.
+    - Results are streamed in tiles of at most tile_size points, so memory stays bounded regardless of grid size.
+
+"""
+
+import math
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from .process_capability import rate_cpa, rate_cpk
+
+DEFAULT_TILE_SIZE: int = 65536
+
+# The closed form threshold in min_tolerance is at most a rounding error or two below the true minimum
+_MAX_NUDGE_ULPS: int = 4
+
+
+class SweepPoint(NamedTuple):
+    """Inputs and calculated metrics for one point of a sweep grid."""
+
+    mean_offset: float
+    stddev: float
+    tolerance: float
+    cp: float
+    cpk: float
+    cpa: float
+    cpk_rating: str
+    cpa_rating: str
+
+
+def linspace(start: float, stop: float, num: int) -> list[float]:
+    """Returns num evenly spaced values from start to stop (both inclusive), for building sweep axes.
+
+    Raises:
+        ValueError: If num is less than 1.
+    """
+    if num < 1:
+        raise ValueError("Number of values must be at least 1.")
+    if num == 1:
+        return [float(start)]
+    step = (stop - start) / (num - 1)
+    return [start + i * step for i in range(num - 1)] + [float(stop)]
+
+
+def iter_sweep(
+    mean_offsets: Iterable[float],
+    stddevs: Iterable[float],
+    tolerances: Iterable[float],
+    tile_size: int = DEFAULT_TILE_SIZE,
+) -> Iterator[list[SweepPoint]]:
+    """Lazily computes Cp, Cpk, Cpa and ratings over the Cartesian grid of the inputs.
+
+    Points are ordered as itertools.product(mean_offsets, stddevs, tolerances), i.e. tolerance varies fastest.
+
+    Args:
+        mean_offsets: Process mean minus nominal. Any iterable of numbers, e.g. a list, range or linspace output.
+        stddevs: Process standard deviations. All must be positive.
+        tolerances: Full spec widths (USL - LSL). All must be positive.
+        tile_size: Maximum number of points per yielded tile. Defaults to DEFAULT_TILE_SIZE.
+
+    Yields:
+        list[SweepPoint]: Consecutive tiles of the grid. Every tile except the last holds exactly tile_size points.
+
+    Raises:
+        ValueError: If any input is not finite, any stddev or tolerance is not positive, tile_size is less than 1, or
+            the inputs are so extreme that metrics overflow the float range.
+    """
+    offsets = _validate_finite(mean_offsets, "Mean offset")
+    sigmas = _validate_positive(stddevs, "Standard deviation")
+    widths = _validate_positive(tolerances, "Tolerance")
+    if tile_size < 1:
+        raise ValueError("Tile size must be at least 1.")
+
+    half_widths = [w / 2 for w in widths]
+
+    # Each metric is monotonic in every input, so if the grid's corner values stay within float range, so does every
+    # point. Checked up front, rather than per point, so overflow fails fast instead of midway through a stream.
+    if offsets and sigmas and widths:
+        max_offset = max(abs(x) for x in offsets)
+        extremes = (
+            6 * max(sigmas),
+            max(widths) / (6 * min(sigmas)),  # Largest Cp
+            max(half_widths) / (3 * min(sigmas)),  # Largest Cpk
+            (min(half_widths) - max_offset) / (3 * min(sigmas)),  # Most negative Cpk
+            max_offset / min(widths),  # Largest |Cpa|
+        )
+        if not all(math.isfinite(x) for x in extremes):
+            raise ValueError("Sweep inputs overflow the float range when computing metrics.")
+
+    tile: list[SweepPoint] = []
+    for offset in offsets:
+        abs_offset = abs(offset)
+        # Cpa: (Mean - Midpoint)/(USL - LSL), independent of stddev so computed once per offset
+        cpas = [offset / w for w in widths]
+        cpa_ratings = [rate_cpa(cpa) for cpa in cpas]
+
+        for stddev in sigmas:
+            six_sigma = 6 * stddev
+            three_sigma = 3 * stddev
+            for w, half_w, cpa, cpa_rating in zip(widths, half_widths, cpas, cpa_ratings):
+                # Cpk: min(Cpu, Cpl) reduces to the distance from the mean to the nearest limit over 3 stddev
+                cpk = (half_w - abs_offset) / three_sigma
+                tile.append(
+                    SweepPoint(
+                        offset, stddev, w, w / six_sigma, cpk, cpa, rate_cpk(cpk), cpa_rating
+                    )
+                )
+                if len(tile) == tile_size:
+                    yield tile
+                    tile = []
+    if tile:
+        yield tile
+
+
+def sweep(
+    mean_offsets: Iterable[float],
+    stddevs: Iterable[float],
+    tolerances: Iterable[float],
+) -> list[SweepPoint]:
+    """Computes the full grid in one list. Convenience for small grids; prefer iter_sweep for large ones.
+
+    See iter_sweep for the arguments and ordering.
+    """
+    return [point for tile in iter_sweep(mean_offsets, stddevs, tolerances) for point in tile]
+
+
+def min_tolerance(
+    stddev: float,
+    target_cpk: float,
+    mean_offset: float = 0.0,
+    tolerances: Iterable[float] | None = None,
+) -> float | None:
+    """Finds the minimum tolerance (USL - LSL) for which Cpk >= target_cpk, without sweeping.
+
+    Cpk rises monotonically with tolerance, so the exact threshold follows from rearranging the Cpk formula:
+    tolerance = 2 * (3 * stddev * target_cpk + |mean_offset|). When candidate tolerances are given (e.g. standard
+    tolerance grades), the smallest qualifying one is found by binary search against that threshold.
+
+    Args:
+        stddev: Process standard deviation. Must be positive.
+        target_cpk: The required Cpk. Must be positive.
+        mean_offset: Process mean minus nominal. Defaults to 0.0 (centered).
+        tolerances: Optional candidate tolerances, in any order. All must be positive. Defaults to None (continuous
+            answer).
+
+    Returns:
+        float | None: The minimum tolerance, or None if no candidate reaches the target.
+
+    Raises:
+        ValueError: If any input is not finite, stddev, target_cpk or any candidate tolerance is not positive, or the
+            result overflows the float range.
+    """
+    (stddev,) = _validate_positive([stddev], "Standard deviation")
+    (target_cpk,) = _validate_positive([target_cpk], "Target Cpk")
+    (mean_offset,) = _validate_finite([mean_offset], "Mean offset")
+    candidates = None if tolerances is None else sorted(_validate_positive(tolerances, "Tolerance"))
+
+    abs_offset = abs(mean_offset)
+    three_sigma = 3 * stddev
+    if not math.isfinite(three_sigma):
+        raise ValueError("Standard deviation overflows the float range when computing Cpk.")
+
+    def meets_target(w: float) -> bool:
+        """Checks Cpk with the same expression as iter_sweep, guarding against float rounding of the threshold."""
+        return (w / 2 - abs_offset) / three_sigma >= target_cpk
+
+    threshold = 2 * (three_sigma * target_cpk + abs_offset)
+    if not math.isfinite(threshold):
+        raise ValueError("Minimum tolerance overflows the float range.")
+    nudges = 0
+    while not meets_target(threshold):
+        if nudges == _MAX_NUDGE_ULPS:
+            raise ValueError(f"Could not resolve a tolerance meeting Cpk >= {target_cpk}.")
+        threshold = math.nextafter(threshold, math.inf)
+        nudges += 1
+
+    if candidates is None:
+        return threshold
+
+    index = bisect_left(candidates, threshold)
+    # The threshold may itself be rounded up, so a candidate just below it can still qualify
+    while index > 0 and meets_target(candidates[index - 1]):
+        index -= 1
+    return candidates[index] if index < len(candidates) else None
+
+
+def _validate_finite(values: Iterable[float], name: str) -> list[float]:
+    """Materializes an input axis as floats, checking all are finite (NaN would otherwise surface deep in rating).
+
+    Raises:
+        ValueError: If any value is NaN or infinite.
+    """
+    floats = [float(x) for x in values]
+    if not all(math.isfinite(x) for x in floats):
+        raise ValueError(f"{name} must be finite.")
+    return floats
+
+
+def _validate_positive(values: Iterable[float], name: str) -> list[float]:
+    """Materializes an input axis as floats, checking all are finite and positive.
+
+    Raises:
+        ValueError: If any value is not finite or not positive.
+    """
+    floats = _validate_finite(values, name)
+    if any(x <= 0 for x in floats):
+        raise ValueError(f"{name} must be positive.")
+    return floats
@@ -0,0 +1,306 @@
+"""
+Exporters
+
+Streaming writers and readers to move large numbers of results in and out of compact formats: JSON Lines, CSV and
+fixed-width packed binary records. The verbose ``metrics`` dictionary is great for humans but wasteful at scale, so each
+result is reduced to a flat record with short field names and ratings stored as integer codes.
+
+Every writer consumes an iterable lazily (so a generator of ProcessCapability objects never needs to be materialized) and
+buffers its output, flushing to the file object in chunks rather than once per record. Each writer has a matching reader
+that yields the same records back, allowing lossless round-trips.
+
+"""
+
+import csv
+import io
+import json
+import math
+import struct
+from collections.abc import Iterable, Iterator
+from typing import IO, TYPE_CHECKING
+
+from ..process_capability import CPA_RATINGS, CPK_RATINGS
+
+if TYPE_CHECKING:
+    from ..process_capability import ProcessCapability
+
+# A compact record maps short field names to a float metric, an integer (sigma level/rating code) or None
+Record = dict[str, float | int | None]
+
+# Short field names in record order. Mapping to the verbose keys of ProcessCapability.metrics:
+#     cp -> Process Capability, cpk -> Process Capability Index, cpu -> Process Capability Upper,
+#     cpl -> Process Capability Lower, cpa -> Process Accuracy, sigma -> Process Sigma Level,
+#     cpk_r -> Process Capability Index Rating, cpa_r -> Process Accuracy Rating
+FIELDS: tuple[str, ...] = ("cp", "cpk", "cpu", "cpl", "cpa", "sigma", "cpk_r", "cpa_r")
+_FLOAT_FIELDS: tuple[str, ...] = FIELDS[:5]
+
+# Binary layout: little-endian, no padding. 5 float64 metrics and int8 rating codes (42 bytes total). Missing floats are
+# stored as NaN and missing codes as the sentinel below. The sigma level is not stored: it is unbounded (it grows without
+# limit as stddev shrinks), so it is derived from cpk on read instead, exactly as iter_records derives it.
+RECORD_FORMAT: str = "<5dbb"
+RECORD_SIZE: int = struct.calcsize(RECORD_FORMAT)
+_MISSING_CODE: int = -1
+
+# Records accumulated in memory before each write to the underlying file
+DEFAULT_BUFFER_SIZE: int = 4096
+
+_CPK_CODES: dict[str, int] = {label: code for code, label in enumerate(CPK_RATINGS)}
+_CPA_CODES: dict[str, int] = {label: code for code, label in enumerate(CPA_RATINGS)}
+
+
+def iter_records(results: Iterable["ProcessCapability"]) -> Iterator[Record]:
+    """Lazily converts ProcessCapability results into compact records.
+
+    Args:
+        results: Any iterable of ProcessCapability instances, e.g. a generator.
+
+    Yields:
+        dict: A record keyed by the short names in FIELDS. The sigma level is an integer (the number shown by
+            ProcessCapability.sigma_level without the σ suffix) and ratings are integer codes, i.e. their index in
+            CPK_RATINGS and CPA_RATINGS.
+    """
+    for pc in results:
+        cpk = pc.process_capability_index
+        cpk_rating = pc.process_capability_index_rating
+        cpa_rating = pc.process_accuracy_rating
+        yield {
+            "cp": pc.process_capability,
+            "cpk": cpk,
+            "cpu": pc.process_capability_upper,
+            "cpl": pc.process_capability_lower,
+            "cpa": pc.process_accuracy,
+            "sigma": _sigma_level(cpk),
+            "cpk_r": _CPK_CODES[cpk_rating] if cpk_rating is not None else None,
+            "cpa_r": _CPA_CODES[cpa_rating] if cpa_rating is not None else None,
+        }
+
+
+def expand_record(record: Record) -> dict[str, float | str | None]:
+    """Expands a compact record back into the verbose form of ProcessCapability.metrics.
+
+    Args:
+        record: A record as produced by iter_records or any of the readers.
+
+    Returns:
+        dict: The same keys and value formats as ProcessCapability.metrics.
+    """
+    sigma = record["sigma"]
+    cpk_code = record["cpk_r"]
+    cpa_code = record["cpa_r"]
+    cpk_rating = CPK_RATINGS[int(cpk_code)] if cpk_code is not None else None
+    cpa_rating = CPA_RATINGS[int(cpa_code)] if cpa_code is not None else None
+    return {
+        "Process Capability": record["cp"],
+        "Process Capability Index": record["cpk"],
+        "Process Capability Upper": record["cpu"],
+        "Process Capability Lower": record["cpl"],
+        "Process Accuracy": record["cpa"],
+        "Process Sigma Level": f"{sigma}σ" if sigma is not None else None,
+        "Process Capability Index Rating": cpk_rating,
+        "Process Accuracy Rating": cpa_rating,
+    }
+
+
+def write_jsonl(
+    results: Iterable["ProcessCapability"], fp: IO[str], buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> int:
+    """Writes results as JSON Lines, one compact object per line.
+
+    Args:
+        results: Any iterable of ProcessCapability instances.
+        fp: A text file object opened for writing.
+        buffer_size: Number of records buffered between writes. Defaults to DEFAULT_BUFFER_SIZE.
+
+    Returns:
+        int: The number of records written.
+
+    Raises:
+        ValueError: If buffer_size is less than 1.
+    """
+    _validate_buffer_size(buffer_size)
+    # A single encoder with no whitespace separators avoids re-creating one per json.dumps call
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    return _write_buffered((encode(r) + "\n" for r in iter_records(results)), fp, buffer_size)
+
+
+def read_jsonl(fp: IO[str]) -> Iterator[Record]:
+    """Lazily reads records written by write_jsonl.
+
+    Args:
+        fp: A text file object opened for reading.
+
+    Yields:
+        dict: One record per non-empty line.
+    """
+    decode = json.JSONDecoder().decode
+    for line in fp:
+        if line.strip():
+            yield decode(line)
+
+
+def write_csv(
+    results: Iterable["ProcessCapability"], fp: IO[str], buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> int:
+    """Writes results as CSV with a header row of short field names. Missing values are left empty.
+
+    Args:
+        results: Any iterable of ProcessCapability instances.
+        fp: A text file object opened for writing, ideally with newline="" as recommended by the csv module.
+        buffer_size: Number of records buffered between writes. Defaults to DEFAULT_BUFFER_SIZE.
+
+    Returns:
+        int: The number of records written (excluding the header).
+
+    Raises:
+        ValueError: If buffer_size is less than 1.
+    """
+    _validate_buffer_size(buffer_size)
+    # csv.writer calls write once per row, so it writes into an in-memory buffer that is flushed to fp in batches
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(FIELDS)
+
+    count = 0
+    for record in iter_records(results):
+        writer.writerow(["" if v is None else v for v in record.values()])
+        count += 1
+        if count % buffer_size == 0:
+            fp.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        fp.write(buffer.getvalue())
+    return count
+
+
+def read_csv(fp: IO[str]) -> Iterator[Record]:
+    """Lazily reads records written by write_csv.
+
+    Args:
+        fp: A text file object opened for reading, ideally with newline="".
+
+    Yields:
+        dict: One record per data row, with types restored (floats for metrics, ints for sigma and ratings).
+
+    Raises:
+        ValueError: If the header does not match FIELDS.
+    """
+    reader = csv.reader(fp)
+    header = next(reader, None)
+    if header is None:
+        return
+    if tuple(header) != FIELDS:
+        raise ValueError(f"Unexpected CSV header {header}, expected {list(FIELDS)}.")
+
+    n_float = len(_FLOAT_FIELDS)
+    for row in reader:
+        values: list[float | int | None] = [float(v) if v else None for v in row[:n_float]]
+        values.extend(int(v) if v else None for v in row[n_float:])
+        yield dict(zip(FIELDS, values))
+
+
+def write_binary(
+    results: Iterable["ProcessCapability"], fp: IO[bytes], buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> int:
+    """Writes results as fixed-width packed records (see RECORD_FORMAT) with no header.
+
+    Args:
+        results: Any iterable of ProcessCapability instances.
+        fp: A binary file object opened for writing.
+        buffer_size: Number of records buffered between writes. Defaults to DEFAULT_BUFFER_SIZE.
+
+    Returns:
+        int: The number of records written.
+
+    Raises:
+        ValueError: If buffer_size is less than 1.
+    """
+    _validate_buffer_size(buffer_size)
+    pack = struct.Struct(RECORD_FORMAT).pack
+    nan = math.nan
+
+    def packed() -> Iterator[bytes]:
+        """Packs each record, substituting NaN/sentinels for missing values."""
+        for r in iter_records(results):
+            yield pack(
+                *(nan if r[f] is None else r[f] for f in _FLOAT_FIELDS),
+                _MISSING_CODE if r["cpk_r"] is None else r["cpk_r"],
+                _MISSING_CODE if r["cpa_r"] is None else r["cpa_r"],
+            )
+
+    return _write_buffered(packed(), fp, buffer_size)
+
+
+def read_binary(fp: IO[bytes], buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[Record]:
+    """Lazily reads records written by write_binary.
+
+    Args:
+        fp: A binary file object opened for reading.
+        buffer_size: Number of records read from the file per chunk. Defaults to DEFAULT_BUFFER_SIZE.
+
+    Yields:
+        dict: One record per packed record, with NaN/sentinels mapped back to None and sigma derived from cpk.
+
+    Raises:
+        ValueError: If buffer_size is less than 1, or the data ends with a partial record.
+    """
+    _validate_buffer_size(buffer_size)
+    record_struct = struct.Struct(RECORD_FORMAT)
+    isnan = math.isnan
+    chunk_bytes = RECORD_SIZE * buffer_size
+    leftover = b""
+    while chunk := fp.read(chunk_bytes):
+        # Pipes and sockets can return short reads, so a partial record is carried over to the next chunk
+        if leftover:
+            chunk = leftover + chunk
+        split = len(chunk) - len(chunk) % RECORD_SIZE
+        leftover = chunk[split:]
+        # iter_unpack decodes the whole chunk in C rather than one unpack call per record
+        for cp, cpk, cpu, cpl, cpa, cpk_r, cpa_r in record_struct.iter_unpack(chunk[:split]):
+            cpk = None if isnan(cpk) else cpk
+            yield {
+                "cp": None if isnan(cp) else cp,
+                "cpk": cpk,
+                "cpu": None if isnan(cpu) else cpu,
+                "cpl": None if isnan(cpl) else cpl,
+                "cpa": None if isnan(cpa) else cpa,
+                "sigma": _sigma_level(cpk),
+                "cpk_r": None if cpk_r == _MISSING_CODE else cpk_r,
+                "cpa_r": None if cpa_r == _MISSING_CODE else cpa_r,
+            }
+    if leftover:
+        raise ValueError(f"Truncated data: trailing {len(leftover)} bytes.")
+
+
+def _validate_buffer_size(buffer_size: int) -> None:
+    """Checks a buffer size, which must be positive to bound and make progress on each read or write.
+
+    Raises:
+        ValueError: If buffer_size is less than 1.
+    """
+    if buffer_size < 1:
+        raise ValueError("Buffer size must be at least 1.")
+
+
+def _sigma_level(cpk: float | None) -> int | None:
+    """Sigma level with the same flooring as ProcessCapability.sigma_level, kept numeric."""
+    return int((cpk * 3) // 1) if cpk is not None else None
+
+
+def _write_buffered(chunks: Iterable, fp: IO, buffer_size: int) -> int:
+    """Joins serialized records into batches of buffer_size and writes each batch with a single call.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    buffer: list = []
+    for chunk in chunks:
+        buffer.append(chunk)
+        if len(buffer) >= buffer_size:
+            fp.write(buffer[0][:0].join(buffer))  # Empty str or bytes, matching the chunk type
+            count += len(buffer)
+            buffer.clear()
+    if buffer:
+        fp.write(buffer[0][:0].join(buffer))
+    return count + len(buffer)
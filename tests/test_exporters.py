@@ -0,0 +1,141 @@
+import io
+
+import pytest
+
+from cpkmetrics.process_capability import ProcessCapability
+from cpkmetrics.utils.exporters import (
+    FIELDS,
+    RECORD_SIZE,
+    expand_record,
+    iter_records,
+    read_binary,
+    read_csv,
+    read_jsonl,
+    write_binary,
+    write_csv,
+    write_jsonl,
+)
+
+# Matching (writer, reader, in-memory file type) triples for every supported format
+FORMATS = [
+    (write_jsonl, read_jsonl, io.StringIO),
+    (write_csv, read_csv, io.StringIO),
+    (write_binary, read_binary, io.BytesIO),
+]
+
+
+def sample_results():
+    """Generator of results covering two-sided and both one-sided specs."""
+    yield ProcessCapability(mean=10, stddev=1, usl=14, lsl=6, print_results=False)
+    yield ProcessCapability(mean=12.5, stddev=0.7, usl=13, lsl=7, print_results=False)
+    yield ProcessCapability(mean=10, stddev=1, usl=13, print_results=False)
+    yield ProcessCapability(mean=10, stddev=2, lsl=11, print_results=False)
+
+
+class TestExporters:
+    """Tests for the compact exporters and readers."""
+
+    def test_iter_records(self):
+        """Test records use short field names, numeric sigma level and rating codes."""
+        record = next(iter_records(sample_results()))
+        assert tuple(record) == FIELDS
+        assert record["sigma"] == 4
+        assert record["cpk_r"] == 4  # Great
+        assert record["cpa_r"] == 0  # Level A
+
+    def test_expand_record_matches_metrics(self):
+        """Test expanding a record reproduces the verbose metrics dictionary."""
+        for pc, record in zip(sample_results(), iter_records(sample_results())):
+            assert expand_record(record) == pc.metrics
+
+    @pytest.mark.parametrize("writer, reader, buffer", FORMATS)
+    @pytest.mark.parametrize("buffer_size", [1, 3, 4096])
+    def test_round_trip(self, writer, reader, buffer, buffer_size):
+        """Test each writer/reader pair round-trips records exactly, regardless of buffering."""
+        fp = buffer()
+        assert writer(sample_results(), fp, buffer_size=buffer_size) == 4
+        fp.seek(0)
+        assert list(reader(fp)) == list(iter_records(sample_results()))
+
+    def test_binary_fixed_width(self):
+        """Test binary output is exactly one fixed-size record per result."""
+        fp = io.BytesIO()
+        write_binary(sample_results(), fp)
+        assert len(fp.getvalue()) == 4 * RECORD_SIZE
+
+    def test_read_binary_truncated(self):
+        """Test a partial trailing record is rejected."""
+        fp = io.BytesIO()
+        write_binary(sample_results(), fp)
+        with pytest.raises(ValueError, match="Truncated"):
+            list(read_binary(io.BytesIO(fp.getvalue()[:-1])))
+
+    def test_read_csv_bad_header(self):
+        """Test a CSV with an unexpected header is rejected."""
+        with pytest.raises(ValueError, match="Unexpected CSV header"):
+            list(read_csv(io.StringIO("a,b\n1,2\n")))
+
+    @pytest.mark.parametrize("writer, reader, buffer", FORMATS)
+    def test_round_trip_extreme_cpk(self, writer, reader, buffer):
+        """Test sigma levels far outside any fixed-width integer range round-trip in every format."""
+        results = [
+            ProcessCapability(mean=0, stddev=1e-5, usl=1, lsl=-1, print_results=False),
+            ProcessCapability(mean=10000, stddev=0.1, usl=1, lsl=-1, print_results=False),
+            ProcessCapability(mean=0, stddev=1e-300, usl=1, print_results=False),
+        ]
+        fp = buffer()
+        writer(results, fp)
+        fp.seek(0)
+        records = list(reader(fp))
+        assert records == list(iter_records(results))
+        assert records[0]["sigma"] > 2**15
+        assert records[1]["sigma"] < -(2**15)
+        assert records[2]["sigma"] > 2**63
+
+    @pytest.mark.parametrize("writer", [write_jsonl, write_csv])
+    def test_text_writes_are_buffered(self, writer):
+        """Test text writers issue one write per buffer_size records rather than one per record."""
+
+        class CountingIO(io.StringIO):
+            """StringIO that counts write calls."""
+
+            writes = 0
+
+            def write(self, s):
+                """Count the call and write through."""
+                self.writes += 1
+                return super().write(s)
+
+        results = [ProcessCapability(10, 1, 13, 7, print_results=False)] * 100
+        fp = CountingIO()
+        assert writer(results, fp, buffer_size=40) == 100
+        assert fp.writes == 3
+        fp.seek(0)
+        assert len(list((read_jsonl if writer is write_jsonl else read_csv)(fp))) == 100
+
+    def test_read_binary_short_reads(self):
+        """Test records split across short reads (as from pipes or sockets) are reassembled."""
+
+        class TrickleIO(io.BytesIO):
+            """BytesIO that returns at most 7 bytes per read."""
+
+            def read(self, size=-1):
+                """Read no more than 7 bytes."""
+                return super().read(min(size, 7) if size >= 0 else 7)
+
+        fp = io.BytesIO()
+        write_binary(sample_results(), fp)
+        assert list(read_binary(TrickleIO(fp.getvalue()))) == list(iter_records(sample_results()))
+
+    @pytest.mark.parametrize("writer, reader, buffer", FORMATS)
+    @pytest.mark.parametrize("buffer_size", [0, -1])
+    def test_invalid_buffer_size(self, writer, reader, buffer, buffer_size):
+        """Test writers, and readers that chunk their input, reject non-positive buffer sizes."""
+        with pytest.raises(ValueError, match="Buffer size must be at least 1."):
+            writer(sample_results(), buffer(), buffer_size=buffer_size)
+        if reader is read_binary:
+            fp = io.BytesIO()
+            write_binary(sample_results(), fp)
+            fp.seek(0)
+            with pytest.raises(ValueError, match="Buffer size must be at least 1."):
+                list(read_binary(fp, buffer_size=buffer_size))
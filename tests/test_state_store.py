@@ -0,0 +1,140 @@
+import statistics
+import time
+
+import pytest
+
+from cpkmetrics.process_capability import ProcessCapability
+from cpkmetrics.state_store import StateStore
+
+MEASUREMENTS = [10.2, 9.8, 10.5, 9.9, 10.1, 10.0, 9.7, 10.4]
+
+
+class TestStateStore:
+    """Tests for the checkpointed state store."""
+
+    def test_update_matches_batch_statistics(self):
+        """Test incremental updates give the same statistics as a single pass over all data."""
+        with StateStore(":memory:") as store:
+            store.update("a", MEASUREMENTS[:3])
+            state = store.update("a", MEASUREMENTS[3:])
+
+        assert state.n == len(MEASUREMENTS)
+        assert state.mean == pytest.approx(statistics.mean(MEASUREMENTS))
+        assert state.stddev == pytest.approx(statistics.stdev(MEASUREMENTS))
+        assert (state.min, state.max) == (min(MEASUREMENTS), max(MEASUREMENTS))
+
+    def test_capability_from_state(self):
+        """Test metrics served from the store match ProcessCapability on the raw statistics."""
+        with StateStore(":memory:") as store:
+            store.set_limits("a", usl=11, lsl=9)
+            store.update("a", MEASUREMENTS)
+            pc = store.capability("a")
+
+        expected = ProcessCapability(
+            statistics.mean(MEASUREMENTS), statistics.stdev(MEASUREMENTS), 11, 9, False
+        )
+        assert pc.process_capability_index == pytest.approx(expected.process_capability_index)
+
+    def test_capability_needs_two_measurements(self):
+        """Test requesting metrics without enough data is rejected."""
+        with StateStore(":memory:") as store:
+            store.set_limits("a", usl=11, lsl=9)
+            store.update("a", [10.0])
+            with pytest.raises(ValueError, match="at least 2 measurements"):
+                store.capability("a")
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        """Test state and watermark survive a close and reopen."""
+        path = str(tmp_path / "state.db")
+        with StateStore(path) as store:
+            store.set_limits("a", usl=11, lsl=9)
+            store.update("a", MEASUREMENTS[:4], watermark=4)
+
+        with StateStore(path) as store:
+            assert store.get("a").watermark == 4
+            store.update("a", MEASUREMENTS[4:], watermark=8)
+            assert store.keys() == ["a"]
+            assert store.get("a").n == len(MEASUREMENTS)
+            assert store.get("a").mean == pytest.approx(statistics.mean(MEASUREMENTS))
+
+    def test_uncheckpointed_updates_lost_consistently(self, tmp_path):
+        """Test that without a checkpoint, statistics and watermark roll back together."""
+        path = str(tmp_path / "state.db")
+        store = StateStore(path, checkpoint_every=None)
+        store.update("a", MEASUREMENTS[:4], watermark=4)
+        assert store.checkpoint() == 1
+        store.update("a", MEASUREMENTS[4:], watermark=8)
+        store._conn.close()  # Simulate a crash: no final checkpoint
+
+        with StateStore(path) as store:
+            assert (store.get("a").n, store.get("a").watermark) == (4, 4)
+
+    def test_automatic_checkpoint(self, tmp_path):
+        """Test a checkpoint is taken once enough measurements are pending."""
+        path = str(tmp_path / "state.db")
+        store = StateStore(path, checkpoint_every=5)
+        store.update("a", MEASUREMENTS[:3])
+        store.update("b", MEASUREMENTS[3:6])
+        store._conn.close()
+
+        with StateStore(path) as store:
+            assert store.keys() == ["a", "b"]
+
+    def test_invalid_checkpoint_interval(self):
+        """Test a non-positive checkpoint interval is rejected."""
+        with pytest.raises(ValueError, match="Checkpoint interval must be at least 1."):
+            StateStore(":memory:", checkpoint_every=0)
+
+    @pytest.mark.parametrize("bad", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_batch_rejected(self, tmp_path, bad):
+        """Test a batch with a non-finite value is rejected whole and other keys still checkpoint."""
+        path = str(tmp_path / "state.db")
+        with StateStore(path, checkpoint_every=None) as store:
+            store.update("good", [1, 2, 3])
+            store.update("bad", [4, 5])
+            with pytest.raises(ValueError, match="must be finite"):
+                store.update("bad", [1, bad])
+            assert store.get("bad").n == 2
+            assert store.checkpoint() == 2
+
+        with StateStore(path) as store:
+            assert (store.get("good").n, store.get("bad").n) == (3, 2)
+
+    def test_set_limits_survives_crash(self, tmp_path):
+        """Test spec limit changes are persisted immediately rather than at the next checkpoint."""
+        path = str(tmp_path / "state.db")
+        store = StateStore(path, checkpoint_every=None)
+        store.set_limits("a", usl=11, lsl=9)
+        store.update("a", MEASUREMENTS, watermark=8)
+        store.set_limits("a", usl=12, lsl=8)
+        store._conn.close()  # Simulate a crash: no final checkpoint
+
+        with StateStore(path) as store:
+            state = store.get("a")
+            assert (state.usl, state.lsl) == (12, 8)
+            assert (state.n, state.watermark) == (len(MEASUREMENTS), 8)
+
+    def test_time_triggered_checkpoint(self, tmp_path, monkeypatch):
+        """Test pending changes are checkpointed once checkpoint_interval has elapsed, regardless of count."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        path = str(tmp_path / "state.db")
+
+        store = StateStore(path, checkpoint_every=None, checkpoint_interval=60)
+        store.update("a", MEASUREMENTS[:2])
+        now[0] += 30
+        store.update("b", MEASUREMENTS[2:4])  # Not yet due
+        now[0] += 30
+        store.update("c", MEASUREMENTS[4:6])  # Due: checkpoints a, b and c
+        now[0] += 30
+        store.update("d", MEASUREMENTS[6:])  # Not due again yet
+        store._conn.close()
+
+        with StateStore(path) as store:
+            assert store.keys() == ["a", "b", "c"]
+
+    @pytest.mark.parametrize("interval", [0, -1, float("nan")])
+    def test_invalid_checkpoint_time_interval(self, interval):
+        """Test a non-positive checkpoint time interval is rejected."""
+        with pytest.raises(ValueError, match="Checkpoint time interval must be positive."):
+            StateStore(":memory:", checkpoint_interval=interval)
@@ -0,0 +1,142 @@
+import pytest
+
+from cpkmetrics.process_capability import ProcessCapability
+from cpkmetrics.sweep import iter_sweep, linspace, min_tolerance, sweep
+
+
+class TestSweep:
+    """Tests for the what-if sweep."""
+
+    def test_sweep_matches_process_capability(self):
+        """Test every grid point agrees with a ProcessCapability built from the equivalent spec."""
+        nominal = 10
+        points = sweep(linspace(-1.5, 1.5, 7), [0.5, 1, 2], range(2, 14, 3))
+        assert len(points) == 7 * 3 * 4
+
+        for p in points:
+            pc = ProcessCapability(
+                mean=nominal + p.mean_offset,
+                stddev=p.stddev,
+                usl=nominal + p.tolerance / 2,
+                lsl=nominal - p.tolerance / 2,
+                print_results=False,
+            )
+            assert p.cp == pytest.approx(pc.process_capability)
+            assert p.cpk == pytest.approx(pc.process_capability_index)
+            assert p.cpa == pytest.approx(pc.process_accuracy)
+            assert p.cpk_rating == pc.process_capability_index_rating
+            assert p.cpa_rating == pc.process_accuracy_rating
+
+    def test_iter_sweep_tiles(self):
+        """Test tiles are bounded by tile_size and preserve product ordering."""
+        tiles = list(iter_sweep([0, 1], [1, 2, 3], [4, 5, 6, 7, 8], tile_size=4))
+        assert [len(t) for t in tiles] == [4, 4, 4, 4, 4, 4, 4, 2]
+        flat = [(p.mean_offset, p.stddev, p.tolerance) for t in tiles for p in t]
+        assert flat == [(o, s, w) for o in (0, 1) for s in (1, 2, 3) for w in (4, 5, 6, 7, 8)]
+
+    @pytest.mark.parametrize(
+        "stddevs, tolerances, tile_size, expected_message",
+        [
+            ([0], [6], 10, "Standard deviation must be positive."),
+            ([1], [-6], 10, "Tolerance must be positive."),
+            ([1], [6], 0, "Tile size must be at least 1."),
+        ],
+    )
+    def test_iter_sweep_invalid_inputs(self, stddevs, tolerances, tile_size, expected_message):
+        """Test invalid axes and tile sizes are rejected."""
+        with pytest.raises(ValueError, match=expected_message):
+            next(iter_sweep([0], stddevs, tolerances, tile_size=tile_size))
+
+    @pytest.mark.parametrize(
+        "stddev, target_cpk, mean_offset, expected",
+        [
+            (1, 1, 0, 6),  # 2 * (3 * 1 * 1 + 0)
+            (1, 1.33, 0, 7.98),
+            (0.5, 1, 1, 5),  # 2 * (3 * 0.5 * 1 + 1)
+            (0.5, 1, -1, 5),
+        ],
+    )
+    def test_min_tolerance_continuous(self, stddev, target_cpk, mean_offset, expected):
+        """Test the continuous minimum tolerance meets the target and matches the closed form."""
+        w = min_tolerance(stddev, target_cpk, mean_offset)
+        assert w == pytest.approx(expected)
+        pc = ProcessCapability(
+            mean=mean_offset, stddev=stddev, usl=w / 2, lsl=-w / 2, print_results=False
+        )
+        assert pc.process_capability_index >= target_cpk
+
+    def test_min_tolerance_candidates(self):
+        """Test the smallest qualifying candidate is chosen, matching a brute force sweep."""
+        candidates = [9, 4, 6, 8, 5, 7]
+        assert min_tolerance(1, 1, tolerances=candidates) == 6
+        assert min_tolerance(1, 1.01, tolerances=candidates) == 7
+        assert min_tolerance(1, 2, tolerances=candidates) is None
+
+        brute = min(p.tolerance for p in sweep([0.3], [0.8], candidates) if p.cpk >= 1.5)
+        assert min_tolerance(0.8, 1.5, 0.3, candidates) == brute
+
+    def test_min_tolerance_invalid_inputs(self):
+        """Test non-positive stddev and target are rejected."""
+        with pytest.raises(ValueError, match="Standard deviation must be positive."):
+            min_tolerance(0, 1)
+        with pytest.raises(ValueError, match="Target Cpk must be positive."):
+            min_tolerance(1, 0)
+
+    @pytest.mark.parametrize(
+        "mean_offsets, stddevs, tolerances, expected_message",
+        [
+            ([float("nan")], [1], [6], "Mean offset must be finite."),
+            ([0], [float("nan")], [6], "Standard deviation must be finite."),
+            ([0], [1], [float("inf")], "Tolerance must be finite."),
+        ],
+    )
+    def test_iter_sweep_non_finite_inputs(
+        self, mean_offsets, stddevs, tolerances, expected_message
+    ):
+        """Test NaN and infinite axis values are rejected up front with a clear message."""
+        with pytest.raises(ValueError, match=expected_message):
+            next(iter_sweep(mean_offsets, stddevs, tolerances))
+
+    @pytest.mark.parametrize(
+        "args, expected_message",
+        [
+            ((float("nan"), 1), "Standard deviation must be finite."),
+            ((1, float("nan")), "Target Cpk must be finite."),
+            ((1, float("inf")), "Target Cpk must be finite."),
+            ((1, 1, float("nan")), "Mean offset must be finite."),
+            ((1, 1, 0, [6, float("nan")]), "Tolerance must be finite."),
+            ((1, 1, 0, [6, 0]), "Tolerance must be positive."),
+            ((1, 1, 0, [6, -8]), "Tolerance must be positive."),
+        ],
+    )
+    def test_min_tolerance_non_finite_inputs(self, args, expected_message):
+        """Test non-finite inputs and invalid candidates are rejected rather than hanging or being returned."""
+        with pytest.raises(ValueError, match=expected_message):
+            min_tolerance(*args)
+
+    @pytest.mark.parametrize(
+        "mean_offsets, stddevs, tolerances",
+        [
+            ([0], [1e308], [6]),  # 6 * stddev overflows
+            ([0], [1e-10], [1e300]),  # Cp overflows
+            ([1e300], [1], [1e-10]),  # Cpa overflows
+            ([-1.7e308], [1e-300], [1.7e308]),  # Cpk overflows
+        ],
+    )
+    def test_iter_sweep_overflow(self, mean_offsets, stddevs, tolerances):
+        """Test finite inputs whose metrics overflow are rejected rather than yielding inf, 0 or NaN."""
+        with pytest.raises(ValueError, match="overflow the float range"):
+            next(iter_sweep(mean_offsets, stddevs, tolerances))
+
+    @pytest.mark.parametrize(
+        "args, expected_message",
+        [
+            ((1e308, 1), "Standard deviation overflows the float range"),
+            ((1e300, 1e10), "Minimum tolerance overflows the float range."),
+            ((1, 1, 1.7e308), "Minimum tolerance overflows the float range."),
+        ],
+    )
+    def test_min_tolerance_overflow(self, args, expected_message):
+        """Test overflow is reported as such rather than as a failure to meet the target."""
+        with pytest.raises(ValueError, match=expected_message):
+            min_tolerance(*args)